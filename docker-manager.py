@@ -6,20 +6,26 @@ Docker Manager - Centralized Docker backup and update management
 import sys
 import os
 import json
-import argparse
+import queue
+import importlib.util
+import re
+import shlex
 import logging
+import textwrap
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime
 
-# Check for required dependencies
+# Check for required dependencies (find_spec locates them without paying the import cost)
 REQUIRED_PACKAGES = ['paramiko', 'yaml', 'requests', 'dateutil']
-missing_packages = []
-
-for package in REQUIRED_PACKAGES:
-    try:
-        __import__(package)
-    except ImportError:
-        missing_packages.append(package)
+missing_packages = [pkg for pkg in REQUIRED_PACKAGES if importlib.util.find_spec(pkg) is None]
 
 if missing_packages:
     print("ERROR: Missing required Python packages:")
@@ -29,9 +35,8 @@ if missing_packages:
     print(f"Location: {Path(__file__).parent}/requirements.txt")
     sys.exit(1)
 
-import yaml
-import paramiko
-import requests
+# yaml, paramiko and requests are imported where first used, so commands that
+# don't need SSH or notifications don't pay for loading them
 from dateutil.relativedelta import relativedelta
 
 # Version
@@ -40,6 +45,70 @@ VERSION = "1.0.0"
 # Default paths
 DEFAULT_CONFIG = Path(__file__).parent / "docker-manager.yml"
 DEFAULT_LOG_DIR = Path("/var/log/docker-manager")
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "docker-manager"
+
+# Default number of hosts/projects processed concurrently
+DEFAULT_MAX_PARALLEL = 8
+# Stay under sshd's MaxSessions (default 10) on each pooled connection
+DEFAULT_MAX_SESSIONS_PER_HOST = 8
+
+# SSH flow control: the 2MB window / 32KB packet defaults cap a channel at
+# window/RTT, far below link speed on high-latency paths
+SSH_WINDOW_SIZE = 2 ** 27
+SSH_MAX_PACKET_SIZE = 2 ** 19
+
+# Units for format_bytes, each 1024x the previous
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Backup filename: {host}-{project}-{YYYYmmdd}-{HHMMSS}.tar.{gz,zst} (project may contain hyphens)
+_BACKUP_SUFFIXES = ('.tar.gz', '.tar.zst')
+_BACKUP_RE = re.compile(r'^(?P<host>[^-]+)-(?P<project>.+)-(?P<date>\d{8})-(?P<time>\d{6})\.tar\.(?:gz|zst)$')
+
+# Notification body headers, built once at import
+_DIVIDER = "━" * 20
+_BACKUP_HEADER = f"💾 Backup Complete\n{_DIVIDER}\n"
+_UPDATE_HEADER = f"🔄 Updates Complete\n{_DIVIDER}\n"
+_CLEANUP_HEADER = f"🧹 Old backups removed\n{_DIVIDER}\n"
+_PRUNE_HEADER = f"🧹 Docker prune completed\n{_DIVIDER}\n"
+
+# ntfy priorities, least to most urgent (used to pick a combined notification's priority)
+_PRIORITY_RANK = {'min': 1, 'low': 2, 'default': 3, 'high': 4, 'urgent': 5}
+
+# ntfy Tags header values, interned once and shared by every notification that uses them
+_TAGS_BACKUP_FAILED = sys.intern('warning,floppy_disk,docker')
+_TAGS_BACKUP_DONE = sys.intern('white_check_mark,floppy_disk,docker')
+_TAGS_BACKUP_NONE = sys.intern('checkmark,floppy_disk,docker')
+_TAGS_UPDATE_FAILED = sys.intern('warning,arrows_counterclockwise,docker')
+_TAGS_UPDATE_DONE = sys.intern('white_check_mark,arrows_counterclockwise,docker')
+_TAGS_UPDATE_NONE = sys.intern('checkmark,docker')
+_TAGS_CLEANUP = sys.intern('broom,floppy_disk')
+_TAGS_PRUNE = sys.intern('broom,docker')
+_TAGS_TEST = sys.intern('test_tube,white_check_mark')
+
+# Summary titles as bound str.format methods, called with (succeeded, failed);
+# format() ignores arguments a title doesn't use
+_TITLE_BACKUP_FAILED = "🐳 Docker Manager: {} backed up, {} failed".format
+_TITLE_BACKUP_DONE = "🐳 Docker Manager: {} backups completed".format
+_TITLE_BACKUP_NONE = "🐳 Docker Manager: All backups up-to-date".format
+_TITLE_UPDATE_FAILED = "🐳 Docker Manager: {} updated, {} failed".format
+_TITLE_UPDATE_DONE = "🐳 Docker Manager: {} updates applied".format
+_TITLE_UPDATE_NONE = "🐳 Docker Manager: All up-to-date".format
+
+# Summary notification (priority, tags, title), keyed by (any failed, any succeeded)
+_BACKUP_FAILED_STATE = ('high', _TAGS_BACKUP_FAILED, _TITLE_BACKUP_FAILED)
+_BACKUP_STATES = {
+    (True, True): _BACKUP_FAILED_STATE,
+    (True, False): _BACKUP_FAILED_STATE,
+    (False, True): ('default', _TAGS_BACKUP_DONE, _TITLE_BACKUP_DONE),
+    (False, False): ('low', _TAGS_BACKUP_NONE, _TITLE_BACKUP_NONE),
+}
+_UPDATE_FAILED_STATE = ('high', _TAGS_UPDATE_FAILED, _TITLE_UPDATE_FAILED)
+_UPDATE_STATES = {
+    (True, True): _UPDATE_FAILED_STATE,
+    (True, False): _UPDATE_FAILED_STATE,
+    (False, True): ('default', _TAGS_UPDATE_DONE, _TITLE_UPDATE_DONE),
+    (False, False): ('low', _TAGS_UPDATE_NONE, _TITLE_UPDATE_NONE),
+}
 
 
 class DockerManager:
@@ -49,8 +118,44 @@ class DockerManager:
         self.config_path = Path(config_path)
         self.config = self.load_config()
         self.logger = self.setup_logging()
+        self._project_defaults = self._get_project_defaults()
+        self._project_config_cache = {}
         self.notifier = Notifier(self.config.get('global', {}).get('notifications', {}), self.logger)
-        
+        self.max_parallel = self.config['global'].get('max_parallel', DEFAULT_MAX_PARALLEL)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_parallel)
+        self.pool = self._create_ssh_pool()
+        self._stats_lock = threading.Lock()
+        self._backup_index = None
+        self._backup_index_lock = threading.Lock()
+        self._cache_dir = Path(self.config['global'].get('cache_dir', DEFAULT_CACHE_DIR)).expanduser()
+        self._find_without_printf = set()
+        # Longest first, so "docker-01" wins over "docker" when splitting backup filenames
+        self._backup_host_names = sorted(self.config['global']['hosts'], key=len, reverse=True)
+        
+    def _create_ssh_pool(self):
+        """Create the SSH connection pool for the configured backend (paramiko or asyncssh)"""
+        backend = self.config['global'].get('ssh_backend', 'paramiko')
+        max_sessions = self.config['global'].get('max_sessions_per_host', DEFAULT_MAX_SESSIONS_PER_HOST)
+        
+        if backend == 'asyncssh':
+            try:
+                import asyncssh
+            except ImportError:
+                print("ERROR: ssh_backend 'asyncssh' requires the asyncssh package")
+                print("\nInstall with: pip install asyncssh")
+                sys.exit(1)
+            return AsyncSSHPool(asyncssh, max_sessions=max_sessions)
+        
+        if backend != 'paramiko':
+            self.logger.warning("Unknown ssh_backend '%s', defaulting to paramiko", backend)
+        return SSHPool(max_sessions=max_sessions)
+    
+    def close(self):
+        """Deliver pending notifications, then release SSH connections and worker threads"""
+        self.notifier.close()
+        self.pool.close()
+        self.executor.shutdown(wait=True)
+    
     def load_config(self):
         """Load configuration from YAML file"""
         if not self.config_path.exists():
@@ -58,8 +163,12 @@ class DockerManager:
             print(f"Create a config file at: {self.config_path}")
             sys.exit(1)
         
+        import yaml
+        
+        # Prefer the LibYAML-backed loader; the pure-Python one is much slower on large configs
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=loader)
     
     def setup_logging(self):
         """Setup logging"""
@@ -68,106 +177,191 @@ class DockerManager:
         
         log_file = log_dir / f"docker-manager-{datetime.now().strftime('%Y%m%d')}.log"
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='[%(asctime)s] %(levelname)s: %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        
+        # Configure our own logger rather than basicConfig, which silently does
+        # nothing if the root logger already has handlers
+        if not logger.handlers:
+            formatter = logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s')
+            for handler in (logging.FileHandler(log_file, mode='a', encoding='utf-8'),
+                            logging.StreamHandler(sys.stdout)):
+                handler.setFormatter(formatter)
+                logger.addHandler(handler)
         
-        return logging.getLogger(__name__)
+        return logger
     
     def test_ssh(self):
         """Test SSH connectivity to all hosts"""
         self.logger.info("Testing SSH connectivity to all hosts...")
         
-        all_success = True
-        for host_name, host_config in self.config['global']['hosts'].items():
-            ip = host_config['ip']
-            
-            try:
-                ssh = paramiko.SSHClient()
-                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                ssh.connect(ip, username='root', timeout=5)
-                
-                stdin, stdout, stderr = ssh.exec_command('echo "SSH OK"')
-                result = stdout.read().decode().strip()
-                
-                if result == "SSH OK":
-                    self.logger.info(f"✓ {host_name} ({ip}): Connected")
-                else:
-                    self.logger.error(f"✗ {host_name} ({ip}): Unexpected response")
-                    all_success = False
-                
-                ssh.close()
-                
-            except Exception as e:
-                self.logger.error(f"✗ {host_name} ({ip}): {str(e)}")
-                all_success = False
-        
-        return all_success
+        hosts = self.config['global']['hosts'].items()
+        return all(list(self.executor.map(self._test_one_host, hosts)))
     
-    def discover_projects(self, target_host=None):
-        """Discover all Docker projects on all hosts (or specific host if specified)"""
-        projects = {}
+    def _test_one_host(self, host_item):
+        """Test SSH connectivity to a single host. Returns True on success."""
+        host_name, host_config = host_item
+        ip = host_config['ip']
         
-        for host_name, host_config in self.config['global']['hosts'].items():
-            # Skip hosts not matching target
-            if target_host and host_name != target_host:
-                continue
+        try:
+            with self.pool.session(ip) as sess:
+                output, _ = sess.run('echo "SSH OK"')
+            result = output.strip()
             
-            ip = host_config['ip']
-            docker_root = host_config['docker_root']
+            if result == "SSH OK":
+                self.logger.info("✓ %s (%s): Connected", host_name, ip)
+                return True
             
-            self.logger.info(f"Discovering projects on {host_name} ({ip})...")
+            self.logger.error("✗ %s (%s): Unexpected response", host_name, ip)
+            return False
             
-            try:
-                ssh = paramiko.SSHClient()
-                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                ssh.connect(ip, username='root', timeout=10)
-                
-                # Find all directories with docker-compose.yml
-                cmd = f"find {docker_root} -maxdepth 2 -name 'docker-compose.yml' -exec dirname {{}} \\;"
-                stdin, stdout, stderr = ssh.exec_command(cmd)
-                
-                project_paths = stdout.read().decode().strip().split('\n')
-                projects[host_name] = []
-                
-                for path in project_paths:
-                    if path:
-                        project_name = Path(path).name
-                        projects[host_name].append({
-                            'name': project_name,
-                            'path': path
-                        })
-                
-                self.logger.info(f"  Found {len(projects[host_name])} projects on {host_name}")
-                
-                ssh.close()
-                
-            except Exception as e:
-                self.logger.error(f"  Error discovering projects on {host_name}: {str(e)}")
-                projects[host_name] = []
+        except Exception as e:
+            self.logger.error("✗ %s (%s): %s", host_name, ip, e)
+            return False
+    
+    def discover_projects(self, target_host=None, refresh=False):
+        """Discover all Docker projects on all hosts (or specific host if specified)"""
+        hosts = {
+            host_name: host_config
+            for host_name, host_config in self.config['global']['hosts'].items()
+            if not target_host or host_name == target_host
+        }
+        
+        # Pre-populate in config order so results don't depend on completion order
+        projects = {host_name: [] for host_name in hosts}
+        
+        futures = {
+            self.executor.submit(self._discover_one_host, host_name, host_config, refresh): host_name
+            for host_name, host_config in hosts.items()
+        }
+        for future in as_completed(futures):
+            projects[futures[future]] = future.result()
         
         return projects
     
-    def get_project_config(self, project_name):
-        """Get configuration for a project (merges defaults with project-specific)"""
-        defaults = {
+    def _discover_one_host(self, host_name, host_config, refresh=False):
+        """Discover Docker projects on a single host. Returns list of project dicts."""
+        ip = host_config['ip']
+        docker_root = host_config['docker_root']
+        root = shlex.quote(docker_root)
+        cache_file = self._cache_dir / f"projects-{host_name}.json"
+        
+        self.logger.info("Discovering projects on %s (%s)...", host_name, ip)
+        
+        try:
+            with self.pool.session(ip) as sess:
+                # Adding/removing a project changes the root's mtime; adding/removing
+                # a compose file changes its project directory's mtime. The globs cover
+                # dot-directories too, since find descends into those as well.
+                output, _ = sess.run(f"stat -c %Y {root} {root}/*/ {root}/.[!.]*/ {root}/..?*/ 2>/dev/null")
+                signature = output.split()
+                
+                cached = None if refresh else self._load_project_cache(cache_file)
+                if (signature and cached and cached.get('docker_root') == docker_root
+                        and cached.get('signature') == signature):
+                    host_projects = cached['projects']
+                    self.logger.info("  Found %d projects on %s (cached)", len(host_projects), host_name)
+                    return host_projects
+                
+                # Find all directories with docker-compose.yml
+                output, find_exit = self._find_project_dirs(sess, host_name, root)
+            
+            if find_exit != 0 and not output.strip():
+                self.logger.error("  Error discovering projects on %s: find failed under %s (exit %d)",
+                                  host_name, docker_root, find_exit)
+                return []
+            
+            project_paths = output.strip().split('\n')
+            host_projects = []
+            
+            for path in project_paths:
+                if path:
+                    project_name = Path(path).name
+                    host_projects.append({
+                        'name': project_name,
+                        'path': path
+                    })
+            
+            self.logger.info("  Found %d projects on %s", len(host_projects), host_name)
+            
+            # Only a complete listing is cached; a partial one would stick until an mtime changes
+            if find_exit != 0:
+                self.logger.warning("  find exited %d on %s; project list may be incomplete and was not cached",
+                                    find_exit, host_name)
+            elif signature:
+                self._save_project_cache(cache_file, {
+                    'docker_root': docker_root,
+                    'signature': signature,
+                    'projects': host_projects
+                })
+            
+            return host_projects
+            
+        except Exception as e:
+            self.logger.error("  Error discovering projects on %s: %s", host_name, e)
+            return []
+    
+    def _find_project_dirs(self, sess, host_name, root):
+        """List directories under docker_root that contain a docker-compose.yml.
+        
+        Returns (output, exit_status) so callers can tell a failed find from an empty root.
+        """
+        find = f"find {root} -maxdepth 2 -name docker-compose.yml"
+        
+        # GNU find prints the parent directory itself; otherwise fall back to one
+        # dirname per match (BSD find has no -printf)
+        if host_name not in self._find_without_printf:
+            output, exit_status = sess.run(f"{find} -printf '%h\\n' 2>/dev/null")
+            if exit_status == 0 or output.strip():
+                return output, exit_status
+        
+        output, exit_status = sess.run(f"{find} -exec dirname {{}} \\; 2>/dev/null")
+        if exit_status == 0:
+            self._find_without_printf.add(host_name)
+        return output, exit_status
+    
+    def _load_project_cache(self, cache_file):
+        """Load a cached project list. Returns None if missing or unreadable."""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_project_cache(self, cache_file, data):
+        """Write a project list cache file (atomically, so readers never see a partial file)"""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.warning("Could not write project cache %s: %s", cache_file, e)
+    
+    def _get_project_defaults(self):
+        """Get global project defaults (computed once, config doesn't change during a run)"""
+        return {
             'retention': self.config['global']['backup'].get('default_retention', 4),
             'schedule': self.config['global']['backup'].get('default_schedule', 'daily'),
             'behavior': self.config['global']['update'].get('default_behavior', 'backup_then_update'),
             'backup_compose': True,
             'exclude_volumes': []
         }
+    
+    def get_project_config(self, project_name):
+        """Get configuration for a project (merges defaults with project-specific)"""
+        config = self._project_config_cache.get(project_name)
+        if config is not None:
+            return config
         
         project_config = self.config.get('projects', {}).get(project_name, {})
         
         # Merge configs (project overrides defaults)
-        config = {**defaults, **project_config}
+        config = {**self._project_defaults, **project_config}
         
+        self._project_config_cache[project_name] = config
         return config
     
     def get_host_prune_config(self, host_name):
@@ -239,7 +433,7 @@ class DockerManager:
         elif schedule == 'monthly':
             return days_since >= 30
         else:
-            self.logger.warning(f"Unknown prune schedule '{schedule}', defaulting to weekly")
+            self.logger.warning("Unknown prune schedule '%s', defaulting to weekly", schedule)
             return days_since >= 7
     
     def run_docker_prune(self, host_name, prune_config):
@@ -247,7 +441,7 @@ class DockerManager:
         host_config = self.config['global']['hosts'][host_name]
         ip = host_config['ip']
         
-        self.logger.info(f"  Running docker prune on {host_name} ({ip})...")
+        self.logger.info("  Running docker prune on %s (%s)...", host_name, ip)
         
         commands = [
             'docker container prune -f',
@@ -258,33 +452,65 @@ class DockerManager:
             commands.append('docker volume prune -f')
         
         try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(ip, username='root', timeout=10)
+            with self.pool.session(ip) as sess:
+                for cmd in commands:
+                    output, _ = sess.run(cmd)
+                    # Log output for debugging
+                    if output.strip():
+                        for line in output.strip().split('\n'):
+                            if 'Total reclaimed space' in line or 'reclaimed' in line.lower():
+                                self.logger.info("    %s: %s", host_name, line.strip())
             
-            total_space = 0
-            for cmd in commands:
-                stdin, stdout, stderr = ssh.exec_command(cmd)
-                output = stdout.read().decode()
-                stderr.read()  # consume stderr
-                # Log output for debugging
-                if output.strip():
-                    for line in output.strip().split('\n'):
-                        if 'Total reclaimed space' in line or 'reclaimed' in line.lower():
-                            self.logger.info(f"    {line.strip()}")
-            
-            ssh.close()
-            self.logger.info(f"    ✓ Docker prune complete on {host_name}")
+            self.logger.info("    ✓ Docker prune complete on %s", host_name)
             return {'status': 'success', 'host': host_name}
             
         except Exception as e:
-            self.logger.error(f"    ✗ Docker prune failed on {host_name}: {str(e)}")
-            try:
-                ssh.close()
-            except:
-                pass
+            self.logger.error("    ✗ Docker prune failed on %s: %s", host_name, e)
             return {'status': 'failed', 'host': host_name, 'error': str(e)}
     
+    def _build_backup_index(self):
+        """Scan the backup root once, indexing (date, path, size) by (host, project), oldest first"""
+        backup_root = self.config['global']['backup']['root']
+        items = []
+        
+        if os.path.isdir(backup_root):
+            # scandir + DirEntry.stat avoids a separate stat() per file at cleanup time
+            with os.scandir(backup_root) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_BACKUP_SUFFIXES):
+                        continue
+                    
+                    parsed = self._parse_backup_name(entry.name)
+                    if parsed is None:
+                        self.logger.warning("Could not parse backup filename: %s", entry.name)
+                        continue
+                    
+                    host, project, backup_date = parsed
+                    items.append((host, project, backup_date, entry.path, entry.stat(follow_symlinks=False).st_size))
+        
+        # One sort orders every group by (host, project) and then oldest first
+        items.sort()
+        index = {
+            key: [item[2:] for item in group]
+            for key, group in groupby(items, key=itemgetter(0, 1))
+        }
+        
+        self._backup_index = index
+        return index
+    
+    def _get_backup_index(self):
+        """Get the backup index, building it on first use"""
+        with self._backup_index_lock:
+            if self._backup_index is None:
+                self._build_backup_index()
+            return self._backup_index
+    
+    def _add_to_backup_index(self, host_name, project_name, backup_date, backup_path, size):
+        """Record a newly created backup so later checks and cleanup see it without rescanning"""
+        index = self._get_backup_index()
+        with self._backup_index_lock:
+            index.setdefault((host_name, project_name), []).append((backup_date, backup_path, size))
+    
     def should_backup(self, host_name, project_name, project_config):
         """Determine if project should be backed up based on schedule"""
         schedule = project_config['schedule']
@@ -295,31 +521,13 @@ class DockerManager:
             return False
         
         # Find last backup
-        backup_root = Path(self.config['global']['backup']['root'])
-        pattern = f"{host_name}-{project_name}-*.tar.gz"
-        
-        backups = sorted(backup_root.glob(pattern), reverse=True)
+        backups = self._get_backup_index().get((host_name, project_name))
         
         if not backups:
             # No backup exists, do it
             return True
         
-        # Parse timestamp from most recent backup
-        last_backup = backups[0]
-        try:
-            # Remove .tar.gz extension first, then split
-            # Format: docker01-joplin-20251205-020004.tar.gz
-            filename_no_ext = last_backup.stem  # Removes .gz -> docker01-joplin-20251205-020004.tar
-            if filename_no_ext.endswith('.tar'):
-                filename_no_ext = filename_no_ext[:-4]  # Remove .tar -> docker01-joplin-20251205-020004
-            
-            parts = filename_no_ext.split('-')
-            # Last two parts should be date and time
-            timestamp_str = parts[-2] + parts[-1]  # 20251205 + 020004
-            last_backup_date = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
-        except Exception as e:
-            self.logger.warning(f"Could not parse backup date from {last_backup.name}: {e}, assuming backup needed")
-            return True
+        last_backup_date = backups[-1][0]
         
         now = datetime.now()
         
@@ -333,147 +541,148 @@ class DockerManager:
         elif schedule == 'monthly':
             return (now - last_backup_date).days >= 30
         else:
-            self.logger.warning(f"Unknown schedule '{schedule}', defaulting to daily")
+            self.logger.warning("Unknown schedule '%s', defaulting to daily", schedule)
             return (now - last_backup_date).days >= 1
     
     def backup_project(self, host_name, project_name, project_path, project_config, force=False):
         """Backup a single project"""
+        # Projects run concurrently, so tag each step line with the project it belongs to
+        log = _ProjectLog(self.logger, host_name, project_name)
         if not force and not self.should_backup(host_name, project_name, project_config):
-            self.logger.info(f"  Skipping {project_name} - not due for backup")
+            log.info("  Skipping - not due for backup")
             return {'status': 'skipped', 'reason': 'schedule'}
         
         host_config = self.config['global']['hosts'][host_name]
         ip = host_config['ip']
         
-        self.logger.info(f"  Backing up {project_name} on {host_name}...")
+        self.logger.info("  Backing up %s on %s...", project_name, host_name)
+        
+        # Determine compression command
+        compression = self.config['global']['backup'].get('compression', 'pigz')
+        compression_level = self.config['global']['backup'].get('compression_level', 6)
+        
+        if compression == 'zstd':
+            # Multi-threaded, with a 128MB long-distance window for repetitive volume data
+            compress_cmd = f"zstd -q -{compression_level} -T0 --long=27"
+            extension = 'tar.zst'
+        elif compression == 'pigz':
+            compress_cmd = f"pigz -{compression_level}"
+            extension = 'tar.gz'
+        else:
+            compress_cmd = f"gzip -{compression_level}"
+            extension = 'tar.gz'
+        
+        # Build tar command with exclusions
+        backup_root = self.config['global']['backup']['root']
+        backup_date = datetime.now().replace(microsecond=0)
+        timestamp = backup_date.strftime('%Y%m%d-%H%M%S')
+        backup_name = f"{host_name}-{project_name}-{timestamp}.{extension}"
+        backup_path = f"{backup_root}/{backup_name}"
+        
+        # Build exclude options
+        excludes = []
+        if project_config.get('backup_compose') == False:
+            excludes += ['docker-compose.yml', 'docker-compose.override.yml', '.env']
+        
+        exclude_volumes = project_config.get('exclude_volumes', [])
+        if 'ALL' in exclude_volumes:
+            # Exclude all directories, only backup compose files
+            excludes.append('*/')
+        else:
+            excludes += exclude_volumes
+        
+        # Add exclusion patterns (global defaults + project-specific)
+        excludes += self.config['global']['backup'].get('default_exclude_patterns', [])
+        excludes += project_config.get('exclude_patterns', [])
+        
+        # Config values are quoted so spaces or quotes in a path/pattern can't break the remote command
+        exclude_opts = ' '.join(shlex.quote(f"--exclude={pattern}") for pattern in excludes)
+        project_dir = shlex.quote(project_path)
+        remote_backup_path = shlex.quote(backup_path)
+        
+        # Check if we should update before restarting (only if containers were running)
+        behavior = project_config.get('behavior', self.config['global']['update'].get('default_behavior', 'backup_then_update'))
+        check_updates = 1 if behavior == 'backup_then_update' else 0
+        
+        # Whole backup runs as one remote script: check state -> stop -> tar -> size -> pull -> start.
+        # Each phase reports back via "###KEY:value" marker lines; everything else in the output is pull output.
+        # The EXIT trap restarts stopped containers if any step fails.
+        script = textwrap.dedent(f"""\
+            set -e
+            cd {project_dir}
+            running=$(docker compose ps -q 2>/dev/null | wc -l)
+            echo "###RUNNING:$running"
+            if [ "$running" -gt 0 ]; then
+                trap 'docker compose up -d >/dev/null 2>&1' EXIT
+                docker compose down >/dev/null 2>&1 || true
+            fi
+            tar {exclude_opts} -cf - . | {compress_cmd} > {remote_backup_path}
+            echo "###SIZE:$(stat -c%s {remote_backup_path})"
+            if [ {check_updates} -eq 1 ] && [ "$running" -gt 0 ]; then
+                pull_exit=0
+                docker compose pull 2>&1 || pull_exit=$?
+                echo "###PULL_EXIT:$pull_exit"
+            fi
+            if [ "$running" -gt 0 ]; then
+                trap - EXIT
+                docker compose up -d >/dev/null 2>&1 || true
+            fi
+            """)
         
         try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(ip, username='root', timeout=10)
-            
-            # Check if containers are running
-            self.logger.info(f"    Checking container state...")
-            stdin, stdout, stderr = ssh.exec_command(f"cd {project_path} && docker compose ps -q 2>/dev/null | wc -l")
-            running_containers = int(stdout.read().decode().strip())
-            was_running = running_containers > 0
-            
-            if was_running:
-                self.logger.info(f"    Containers running: {running_containers}")
-            else:
-                self.logger.info(f"    No containers running")
-            
-            # Stop containers if they were running
-            if was_running:
-                self.logger.info(f"    Stopping containers...")
-                stdin, stdout, stderr = ssh.exec_command(f"cd {project_path} && docker compose down")
-                stdout.channel.recv_exit_status()  # Wait for completion
-            
-            # Build tar command with exclusions
-            backup_root = self.config['global']['backup']['root']
-            timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-            backup_name = f"{host_name}-{project_name}-{timestamp}.tar.gz"
-            backup_path = f"{backup_root}/{backup_name}"
-            
-            # Build exclude options
-            exclude_opts = ""
-            if project_config.get('backup_compose') == False:
-                exclude_opts += " --exclude='docker-compose.yml' --exclude='docker-compose.override.yml' --exclude='.env'"
+            log.info("    Creating backup...")
+            with self.pool.session(ip) as sess:
+                output, exit_status = sess.run(script)
             
-            exclude_volumes = project_config.get('exclude_volumes', [])
-            if 'ALL' in exclude_volumes:
-                # Exclude all directories, only backup compose files
-                exclude_opts += " --exclude='*/'"
-            else:
-                for vol in exclude_volumes:
-                    exclude_opts += f" --exclude='{vol}'"
-            
-            # Add exclusion patterns (global defaults + project-specific)
-            global_patterns = self.config['global']['backup'].get('default_exclude_patterns', [])
-            project_patterns = project_config.get('exclude_patterns', [])
-            all_patterns = global_patterns + project_patterns
-            
-            for pattern in all_patterns:
-                exclude_opts += f" --exclude='{pattern}'"
-            
-            # Determine compression command
-            compression = self.config['global']['backup'].get('compression', 'pigz')
-            compression_level = self.config['global']['backup'].get('compression_level', 6)
-            
-            if compression == 'pigz':
-                compress_cmd = f"pigz -{compression_level}"
-            else:
-                compress_cmd = f"gzip -{compression_level}"
-            
-            # Create backup
-            self.logger.info(f"    Creating backup...")
-            tar_cmd = f"cd {project_path} && tar {exclude_opts} -cf - . | {compress_cmd} > {backup_path}"
-            stdin, stdout, stderr = ssh.exec_command(tar_cmd)
-            exit_status = stdout.channel.recv_exit_status()
+            markers = dict(re.findall(r'^###(\w+):(.*)$', output, re.M))
+            pull_output = '\n'.join(line for line in output.splitlines() if not line.startswith('###'))
             
             if exit_status != 0:
-                error = stderr.read().decode()
-                raise Exception(f"Backup failed: {error}")
+                raise Exception(f"Backup failed: {pull_output.strip()[-500:]}")
             
-            # Get backup size
-            stdin, stdout, stderr = ssh.exec_command(f"stat -c%s {backup_path}")
-            size_bytes = int(stdout.read().decode().strip())
+            running_containers = int(markers['RUNNING'])
+            was_running = running_containers > 0
+            size_bytes = int(markers['SIZE'])
             
-            self.logger.info(f"    ✓ Backup complete: {backup_name} ({self.format_bytes(size_bytes)})")
+            if was_running:
+                log.info("    Containers running: %d (stopped for backup)", running_containers)
+            else:
+                log.info("    No containers running")
             
-            # Check if we should update before restarting (only if containers were running)
-            behavior = project_config.get('behavior', self.config['global']['update'].get('default_behavior', 'backup_then_update'))
-            should_update = behavior == 'backup_then_update' and was_running
+            log.info("    ✓ Backup complete: %s (%s)", backup_name, self.format_bytes(size_bytes))
+            self._add_to_backup_index(host_name, project_name, backup_date, backup_path, size_bytes)
             
             update_status = None
             images_updated = 0
             
-            if should_update:
-                # Pull updates while containers are still down
-                self.logger.info(f"    Checking for updates...")
-                
-                # Get current image digests
-                stdin, stdout, stderr = ssh.exec_command(
-                    f"cd {project_path} && docker compose images -q 2>/dev/null | xargs -r docker inspect --format='{{{{.Id}}}}' 2>/dev/null | sort"
-                )
-                old_digests = stdout.read().decode().strip()
-                
-                # Pull updates
-                stdin, stdout, stderr = ssh.exec_command(f"cd {project_path} && docker compose pull 2>&1")
-                pull_output = stdout.read().decode()
-                pull_exit = stdout.channel.recv_exit_status()
+            if check_updates and was_running:
+                # Updates were pulled while containers were still down
+                pull_exit = int(markers['PULL_EXIT'])
                 
                 # Check for errors
                 if pull_exit != 0 and 'Error' in pull_output and 'must be built from source' not in pull_output:
-                    self.logger.warning(f"    Pull had errors: {pull_output[:200]}")
-                
-                # Get new image digests
-                stdin, stdout, stderr = ssh.exec_command(
-                    f"cd {project_path} && docker compose images -q 2>/dev/null | xargs -r docker inspect --format='{{{{.Id}}}}' 2>/dev/null | sort"
-                )
-                new_digests = stdout.read().decode().strip()
+                    log.warning("    Pull had errors: %s", pull_output[:200])
                 
                 # Check if anything changed
-                if old_digests != new_digests:
-                    images_updated = pull_output.count('Downloaded newer image') + pull_output.count('Pulled')
-                    self.logger.info(f"    ✓ Updates found: {images_updated} image(s) pulled")
+                images_updated = self._count_pulled_images(pull_output)
+                if images_updated is None:
+                    log.info("    ✓ Updates found: new image layers pulled")
+                    update_status = 'updated'
+                elif images_updated > 0:
+                    log.info("    ✓ Updates found: %d image(s) pulled", images_updated)
                     update_status = 'updated'
                 else:
-                    self.logger.info(f"    ✓ No updates available")
+                    log.info("    ✓ No updates available")
                     update_status = 'up-to-date'
-            elif not was_running and behavior == 'backup_then_update':
-                self.logger.info(f"    Skipping updates - containers were not running")
+            elif check_updates:
+                log.info("    Skipping updates - containers were not running")
                 update_status = 'skipped'
             
-            # Restart containers only if they were originally running
+            # Containers are restarted only if they were originally running
             if was_running:
-                self.logger.info(f"    Starting containers...")
-                stdin, stdout, stderr = ssh.exec_command(f"cd {project_path} && docker compose up -d")
-                stdout.channel.recv_exit_status()
+                log.info("    Containers started")
             else:
-                self.logger.info(f"    Containers remain stopped (original state)")
-            
-            ssh.close()
+                log.info("    Containers remain stopped (original state)")
             
             return {
                 'status': 'success',
@@ -485,80 +694,53 @@ class DockerManager:
             }
             
         except Exception as e:
-            self.logger.error(f"    ✗ Backup failed: {str(e)}")
-            
-            # Try to restart containers if they were stopped
-            try:
-                stdin, stdout, stderr = ssh.exec_command(f"cd {project_path} && docker compose up -d")
-                stdout.channel.recv_exit_status()
-                ssh.close()
-            except:
-                pass
-            
+            log.error("    ✗ Backup failed: %s", e)
             return {'status': 'failed', 'error': str(e)}
     
     def update_project(self, host_name, project_name, project_path, project_config):
         """Update a single project"""
+        log = _ProjectLog(self.logger, host_name, project_name)
         behavior = project_config['behavior']
         
         # Check if updates are allowed for this project
         if behavior == 'backup_only':
-            self.logger.info(f"  Skipping update for {project_name} - backup_only mode")
+            log.info("  Skipping update - backup_only mode")
             return {'status': 'skipped', 'reason': 'backup_only'}
         
         host_config = self.config['global']['hosts'][host_name]
         ip = host_config['ip']
         
-        self.logger.info(f"  Checking for updates for {project_name} on {host_name}...")
+        project_dir = shlex.quote(project_path)
+        
+        self.logger.info("  Checking for updates for %s on %s...", project_name, host_name)
         
         try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(ip, username='root', timeout=10)
-            
-            # Get current image digests
-            stdin, stdout, stderr = ssh.exec_command(
-                f"cd {project_path} && docker compose images -q 2>/dev/null | xargs -r docker inspect --format='{{{{.Id}}}}' 2>/dev/null | sort"
-            )
-            old_digests = stdout.read().decode().strip()
-            
-            # Pull updates
-            self.logger.info(f"    Pulling updates...")
-            stdin, stdout, stderr = ssh.exec_command(f"cd {project_path} && docker compose pull 2>&1")
-            pull_output = stdout.read().decode()
-            pull_exit = stdout.channel.recv_exit_status()
-            
-            # Check for errors
-            if pull_exit != 0 and 'Error' in pull_output and 'must be built from source' not in pull_output:
-                raise Exception(f"Pull failed: {pull_output}")
-            
-            # Get new image digests
-            stdin, stdout, stderr = ssh.exec_command(
-                f"cd {project_path} && docker compose images -q 2>/dev/null | xargs -r docker inspect --format='{{{{.Id}}}}' 2>/dev/null | sort"
-            )
-            new_digests = stdout.read().decode().strip()
-            
-            # Check if anything changed
-            if old_digests == new_digests:
-                self.logger.info(f"    ✓ Up-to-date - no updates needed")
-                ssh.close()
-                return {'status': 'up-to-date'}
-            
-            # Count updated images
-            images_updated = pull_output.count('Downloaded newer image') + pull_output.count('Pulled')
-            
-            # Recreate containers
-            self.logger.info(f"    Recreating containers...")
-            stdin, stdout, stderr = ssh.exec_command(f"cd {project_path} && docker compose up -d 2>&1")
-            up_output = stdout.read().decode()
-            up_exit = stdout.channel.recv_exit_status()
-            
-            if up_exit != 0:
-                raise Exception(f"Container restart failed: {up_output}")
-            
-            ssh.close()
+            with self.pool.session(ip) as sess:
+                # Pull updates
+                log.info("    Pulling updates...")
+                pull_output, pull_exit = sess.run(f"cd {project_dir} && docker compose pull")
+                
+                # Check for errors
+                if pull_exit != 0 and 'Error' in pull_output and 'must be built from source' not in pull_output:
+                    raise Exception(f"Pull failed: {pull_output}")
+                
+                # Check if anything changed
+                images_updated = self._count_pulled_images(pull_output)
+                if images_updated == 0:
+                    log.info("    ✓ Up-to-date - no updates needed")
+                    return {'status': 'up-to-date'}
+                
+                # Recreate containers
+                log.info("    Recreating containers...")
+                up_output, up_exit = sess.run(f"cd {project_dir} && docker compose up -d")
+                
+                if up_exit != 0:
+                    raise Exception(f"Container restart failed: {up_output}")
             
-            self.logger.info(f"    ✓ Updated successfully - {images_updated} image(s) pulled")
+            if images_updated is None:
+                log.info("    ✓ Updated successfully - new image layers pulled")
+            else:
+                log.info("    ✓ Updated successfully - %d image(s) pulled", images_updated)
             
             return {
                 'status': 'updated',
@@ -566,63 +748,38 @@ class DockerManager:
             }
             
         except Exception as e:
-            self.logger.error(f"    ✗ Update failed: {str(e)}")
-            try:
-                ssh.close()
-            except:
-                pass
+            log.error("    ✗ Update failed: %s", e)
             return {'status': 'failed', 'error': str(e)}
     
     def cleanup_backups(self):
         """Clean up old backups based on retention policy"""
         self.logger.info("Cleaning up old backups...")
         
-        backup_root = Path(self.config['global']['backup']['root'])
         removed_count = 0
         freed_space = 0
+        expired = []
         
-        # Group backups by host-project
-        backup_groups = {}
-        
-        for backup_file in backup_root.glob("*-*-*.tar.gz"):
-            try:
-                parts = backup_file.stem.split('-')
-                host = parts[0]
-                # Project name might have hyphens, so join everything except last 2 parts (timestamp)
-                project = '-'.join(parts[1:-2])
-                
-                key = f"{host}-{project}"
-                if key not in backup_groups:
-                    backup_groups[key] = []
-                backup_groups[key].append(backup_file)
-            except:
-                self.logger.warning(f"Could not parse backup filename: {backup_file.name}")
-                continue
-        
-        # Clean up each group based on retention
-        for key, backups in backup_groups.items():
-            host, project = key.split('-', 1)
+        # Clean up each (host, project) group based on retention
+        for (host, project), backups in self._get_backup_index().items():
             project_config = self.get_project_config(project)
             retention = project_config['retention']
             
-            # Sort by date (newest first)
-            backups = sorted(backups, reverse=True)
-            
-            # Keep only the last N backups
-            to_remove = backups[retention:]
+            # Keep only the last N backups (index is sorted oldest first)
+            remove_count = max(len(backups) - retention, 0)
+            to_remove = list(reversed(backups[:remove_count]))
+            del backups[:remove_count]
             
             if to_remove:
-                self.logger.info(f"  {project} on {host}: Removing {len(to_remove)} old backup(s)")
-                
-                for backup in to_remove:
-                    size = backup.stat().st_size
-                    backup.unlink()
-                    removed_count += 1
-                    freed_space += size
-                    self.logger.info(f"    Removed: {backup.name}")
+                self.logger.info("  %s on %s: Removing %d old backup(s)", project, host, len(to_remove))
+                expired.extend(to_remove)
+        
+        # unlink is I/O bound (especially on NFS), so delete across the worker pool
+        for size in self.executor.map(self._remove_backup, expired):
+            removed_count += 1
+            freed_space += size
         
         if removed_count > 0:
-            self.logger.info(f"✓ Cleanup complete: {removed_count} backup(s) removed, {self.format_bytes(freed_space)} freed")
+            self.logger.info("✓ Cleanup complete: %d backup(s) removed, %s freed", removed_count, self.format_bytes(freed_space))
             
             # Send notification
             if self.notifier.enabled:
@@ -632,6 +789,13 @@ class DockerManager:
         
         return removed_count, freed_space
     
+    def _remove_backup(self, backup):
+        """Delete one backup file from the index. Returns its size."""
+        _, backup_path, size = backup
+        os.unlink(backup_path)
+        self.logger.info("    Removed: %s", os.path.basename(backup_path))
+        return size
+    
     def cleanup_logs(self):
         """Clean up old log files based on log_retention_days"""
         log_dir = Path(self.config['global'].get('log_dir', DEFAULT_LOG_DIR))
@@ -640,7 +804,7 @@ class DockerManager:
         if not log_dir.exists():
             return 0
         
-        self.logger.info(f"Cleaning up logs older than {retention_days} days...")
+        self.logger.info("Cleaning up logs older than %s days...", retention_days)
         removed_count = 0
         cutoff = datetime.now() - relativedelta(days=retention_days)
         
@@ -652,41 +816,48 @@ class DockerManager:
                 if log_date < cutoff:
                     log_file.unlink()
                     removed_count += 1
-                    self.logger.info(f"  Removed: {log_file.name}")
+                    self.logger.info("  Removed: %s", log_file.name)
             except ValueError:
-                self.logger.warning(f"Could not parse date from {log_file.name}, skipping")
+                self.logger.warning("Could not parse date from %s, skipping", log_file.name)
                 continue
         
         if removed_count > 0:
-            self.logger.info(f"✓ Log cleanup complete: {removed_count} log(s) removed")
+            self.logger.info("✓ Log cleanup complete: %d log(s) removed", removed_count)
         else:
             self.logger.info("✓ No old logs to remove")
         
         return removed_count
     
-    def run(self, force=False, target_host=None, target_project=None, operation='all'):
+    def run(self, force=False, target_host=None, target_project=None, operation='all', refresh=False):
         """Run scheduled backup and update operations"""
         self.logger.info("=" * 50)
-        self.logger.info(f"Docker Manager Run Started (force={force})")
+        self.logger.info("Docker Manager Run Started (force=%s)", force)
         self.logger.info("=" * 50)
         
         # Docker prune on hosts (if due per schedule)
         if operation == 'all':
-            prune_hosts = []
+            prune_targets = []
             for host_name in self.config['global']['hosts']:
                 if target_host and host_name != target_host:
                     continue
                 prune_config = self.get_host_prune_config(host_name)
                 if prune_config['enabled'] and self.should_run_docker_prune(host_name, prune_config, force):
-                    result = self.run_docker_prune(host_name, prune_config)
-                    if result['status'] == 'success':
-                        self._record_prune_timestamp(host_name)
-                        prune_hosts.append(host_name)
+                    prune_targets.append((host_name, prune_config))
+            
+            prune_hosts = []
+            results = self.executor.map(lambda target: self.run_docker_prune(*target), prune_targets)
+            for (host_name, _), result in zip(prune_targets, results):
+                if result['status'] == 'success':
+                    self._record_prune_timestamp(host_name)
+                    prune_hosts.append(host_name)
             if prune_hosts and self.notifier.enabled:
                 self.notifier.send_prune_notification(prune_hosts)
         
+        # Index existing backups once for the schedule checks and cleanup below
+        self._build_backup_index()
+        
         # Discover projects (optionally filter by target_host)
-        all_projects = self.discover_projects(target_host=target_host)
+        all_projects = self.discover_projects(target_host=target_host, refresh=refresh)
         
         # Statistics
         stats = {
@@ -703,67 +874,27 @@ class DockerManager:
             'total_backup_size': 0
         }
         
-        # Process each host
+        # Build the (host, project) work list
+        tasks = []
         for host_name, projects in all_projects.items():
             if target_host and host_name != target_host:
                 continue
             
-            self.logger.info(f"Processing {host_name}...")
-            
             for project in projects:
-                project_name = project['name']
-                project_path = project['path']
-                
-                if target_project and project_name != target_project:
+                if target_project and project['name'] != target_project:
                     continue
-                
-                stats['total_projects'] += 1
-                project_config = self.get_project_config(project_name)
-                
-                self.logger.info(f"  {project_name}:")
-                
-                # Backup (may include update if behavior is backup_then_update)
-                if operation in ['all', 'backup']:
-                    stats['backups_attempted'] += 1
-                    backup_result = self.backup_project(host_name, project_name, project_path, project_config, force)
-                    
-                    if backup_result['status'] == 'success':
-                        stats['backups_successful'] += 1
-                        stats['total_backup_size'] += backup_result['size']
-                        stats['total_containers'] += backup_result.get('containers', 0)
-                        
-                        # Track update stats if backup included update check
-                        update_status = backup_result.get('update_status')
-                        if update_status:
-                            stats['updates_attempted'] += 1
-                            if update_status == 'updated':
-                                stats['updates_successful'] += 1
-                            elif update_status in ['up-to-date', 'skipped']:
-                                stats['updates_skipped'] += 1
-                    elif backup_result['status'] == 'failed':
-                        stats['backups_failed'] += 1
-                        # Skip standalone update if backup failed
-                        continue
-                    elif backup_result['status'] == 'skipped':
-                        stats['backups_skipped'] += 1
-                
-                # Standalone update (only if not already done during backup)
-                if operation in ['all', 'update']:
-                    behavior = project_config.get('behavior', self.config['global']['update'].get('default_behavior', 'backup_then_update'))
-                    
-                    # Skip if backup already handled the update
-                    if operation == 'all' and behavior == 'backup_then_update':
-                        continue
-                    
-                    stats['updates_attempted'] += 1
-                    update_result = self.update_project(host_name, project_name, project_path, project_config)
-                    
-                    if update_result['status'] == 'updated':
-                        stats['updates_successful'] += 1
-                    elif update_result['status'] == 'failed':
-                        stats['updates_failed'] += 1
-                    elif update_result['status'] in ['skipped', 'up-to-date']:
-                        stats['updates_skipped'] += 1
+                tasks.append((host_name, project))
+        
+        self.logger.info("Processing %d project(s) (max_parallel=%s)...", len(tasks), self.max_parallel)
+        
+        # Process each project concurrently; tasks share one pooled SSH transport per host,
+        # each opening its own session channel on it
+        futures = [
+            self.executor.submit(self._process_project, host_name, project, force, operation, stats)
+            for host_name, project in tasks
+        ]
+        for future in as_completed(futures):
+            future.result()
         
         # Cleanup old backups
         if operation in ['all', 'backup']:
@@ -776,10 +907,10 @@ class DockerManager:
         self.logger.info("=" * 50)
         self.logger.info("Summary")
         self.logger.info("=" * 50)
-        self.logger.info(f"Total Projects: {stats['total_projects']}")
-        self.logger.info(f"Backups: {stats['backups_successful']} successful, {stats['backups_failed']} failed, {stats['backups_skipped']} skipped")
-        self.logger.info(f"Updates: {stats['updates_successful']} successful, {stats['updates_failed']} failed, {stats['updates_skipped']} skipped")
-        self.logger.info(f"Total Backup Size: {self.format_bytes(stats['total_backup_size'])}")
+        self.logger.info("Total Projects: %d", stats['total_projects'])
+        self.logger.info("Backups: %d successful, %d failed, %d skipped", stats['backups_successful'], stats['backups_failed'], stats['backups_skipped'])
+        self.logger.info("Updates: %d successful, %d failed, %d skipped", stats['updates_successful'], stats['updates_failed'], stats['updates_skipped'])
+        self.logger.info("Total Backup Size: %s", self.format_bytes(stats['total_backup_size']))
         
         # Wait for services (like ntfy) to be fully ready before sending notifications
         if self.notifier.enabled:
@@ -792,20 +923,377 @@ class DockerManager:
             if operation in ['all', 'backup']:
                 self.notifier.send_backup_summary(stats)
             if operation in ['all', 'update']:
-                import time
-                time.sleep(1)  # Small delay between notifications
                 self.notifier.send_update_summary(stats)
+            self.notifier.flush()
         
         return stats
     
+    def _process_project(self, host_name, project, force, operation, stats):
+        """Backup and/or update a single project, merging its counts into stats"""
+        project_name = project['name']
+        project_path = project['path']
+        project_config = self.get_project_config(project_name)
+        
+        # Counted locally, then merged into the shared stats under the lock
+        counts = dict.fromkeys(stats, 0)
+        counts['total_projects'] += 1
+        
+        self.logger.info("  %s (%s):", project_name, host_name)
+        
+        try:
+            # Backup (may include update if behavior is backup_then_update)
+            if operation in ['all', 'backup']:
+                counts['backups_attempted'] += 1
+                backup_result = self.backup_project(host_name, project_name, project_path, project_config, force)
+                
+                if backup_result['status'] == 'success':
+                    counts['backups_successful'] += 1
+                    counts['total_backup_size'] += backup_result['size']
+                    counts['total_containers'] += backup_result.get('containers', 0)
+                    
+                    # Track update stats if backup included update check
+                    update_status = backup_result.get('update_status')
+                    if update_status:
+                        counts['updates_attempted'] += 1
+                        if update_status == 'updated':
+                            counts['updates_successful'] += 1
+                        elif update_status in ['up-to-date', 'skipped']:
+                            counts['updates_skipped'] += 1
+                elif backup_result['status'] == 'failed':
+                    counts['backups_failed'] += 1
+                    # Skip standalone update if backup failed
+                    return
+                elif backup_result['status'] == 'skipped':
+                    counts['backups_skipped'] += 1
+            
+            # Standalone update (only if not already done during backup)
+            if operation in ['all', 'update']:
+                behavior = project_config.get('behavior', self.config['global']['update'].get('default_behavior', 'backup_then_update'))
+                
+                # Skip if backup already handled the update
+                if operation == 'all' and behavior == 'backup_then_update':
+                    return
+                
+                counts['updates_attempted'] += 1
+                update_result = self.update_project(host_name, project_name, project_path, project_config)
+                
+                if update_result['status'] == 'updated':
+                    counts['updates_successful'] += 1
+                elif update_result['status'] == 'failed':
+                    counts['updates_failed'] += 1
+                elif update_result['status'] in ['skipped', 'up-to-date']:
+                    counts['updates_skipped'] += 1
+        finally:
+            with self._stats_lock:
+                for key, value in counts.items():
+                    stats[key] += value
+    
     @staticmethod
+    def _count_pulled_images(pull_output):
+        """Count images updated by `docker compose pull`, from its output alone.
+        
+        Returns None when layers were downloaded but the image count is unknown:
+        Compose v2 prints "<service> Pulled" for every service, even when the image
+        was already current, and its "Pull complete" lines name layers, not images.
+        """
+        newer = pull_output.count('Downloaded newer image')
+        if newer:
+            return newer
+        if 'Pull complete' in pull_output:
+            return None
+        return 0
+    
+    def _parse_backup_name(self, name):
+        """Parse a backup filename into (host, project, datetime). Returns None if it isn't one.
+        
+        Host and project are both free to contain hyphens, so the split uses the
+        configured host names; the regex split is only a fallback for unknown hosts.
+        """
+        match = _BACKUP_RE.match(name)
+        if match is None:
+            return None
+        
+        host, project = match['host'], match['project']
+        stem = f"{host}-{project}"
+        for host_name in self._backup_host_names:
+            if len(stem) > len(host_name) + 1 and stem.startswith(f"{host_name}-"):
+                host, project = host_name, stem[len(host_name) + 1:]
+                break
+        
+        # Build the datetime directly; much cheaper than strptime per file
+        date, time = match['date'], match['time']
+        try:
+            backup_date = datetime(
+                int(date[:4]), int(date[4:6]), int(date[6:8]),
+                int(time[:2]), int(time[2:4]), int(time[4:6])
+            )
+        except ValueError:
+            return None
+        
+        return host, project, backup_date
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
     def format_bytes(bytes_val):
-        """Format bytes to human readable"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_val < 1024.0:
-                return f"{bytes_val:.2f}{unit}"
-            bytes_val /= 1024.0
-        return f"{bytes_val:.2f}PB"
+        """Format bytes to human readable (memoized; repeated totals such as 0 are common)"""
+        if bytes_val <= 0:
+            return "0.00B"
+        # Unit index from the bit length (each unit is 2**10), so a single division;
+        # clamped at 0 since values below 1 have bit length 0
+        index = min(max((int(bytes_val).bit_length() - 1) // 10, 0), len(_BYTE_UNITS) - 1)
+        return f"{bytes_val / (1 << (10 * index)):.2f}{_BYTE_UNITS[index]}"
+
+
+class _ProjectLog(logging.LoggerAdapter):
+    """Logger adapter that tags messages with host/project, keeping their indentation"""
+    
+    def __init__(self, logger, host_name, project_name):
+        super().__init__(logger, {'tag': f"[{host_name}/{project_name}]"})
+    
+    def process(self, msg, kwargs):
+        body = msg.lstrip(' ')
+        return f"{msg[:len(msg) - len(body)]}{self.extra['tag']} {body}", kwargs
+
+
+class SSHPool:
+    """Per-host cache of authenticated SSH connections, shared across worker threads.
+    
+    Each host gets a single transport; sessions are opened as channels on it and
+    capped by a per-host semaphore so concurrent workers stay under sshd's
+    MaxSessions instead of having channel opens rejected.
+    """
+    
+    def __init__(self, username='root', timeout=10, keepalive=30, max_sessions=DEFAULT_MAX_SESSIONS_PER_HOST):
+        self.username = username
+        self.timeout = timeout
+        self.keepalive = keepalive
+        self.max_sessions = max(int(max_sessions), 1)
+        self._clients = {}
+        self._host_locks = {}
+        self._host_sems = {}
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def transport(self, ip):
+        """Get the connected transport for a host, (re)connecting if needed"""
+        # Per-host lock so a slow connect to one host doesn't block the others
+        with self._lock:
+            host_lock = self._host_locks.setdefault(ip, threading.Lock())
+        
+        with host_lock:
+            client = self._clients.get(ip)
+            if client is not None:
+                transport = client.get_transport()
+                if transport is not None and transport.is_active():
+                    return transport
+                client.close()
+            
+            import paramiko
+            
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.connect(ip, username=self.username, timeout=self.timeout)
+            transport = client.get_transport()
+            transport.set_keepalive(self.keepalive)
+            self._clients[ip] = client
+            return transport
+    
+    def session(self, ip):
+        """Open a persistent shell session on the pooled connection for a host.
+        
+        Blocks while the host already has max_sessions sessions open; the slot
+        is released when the session is closed.
+        """
+        with self._lock:
+            semaphore = self._host_sems.setdefault(ip, threading.BoundedSemaphore(self.max_sessions))
+        
+        semaphore.acquire()
+        try:
+            return SSHSession(self.transport(ip), release=semaphore.release)
+        except Exception:
+            semaphore.release()
+            raise
+    
+    def close(self):
+        """Close all pooled connections"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+
+class SSHSession:
+    """Persistent remote shell on a single channel.
+    
+    Commands are written to one long-lived shell and delimited by a sentinel
+    line, so consecutive commands for a project don't each open a new channel.
+    """
+    
+    def __init__(self, transport, release=None):
+        self._release = release
+        self._end_marker = f"__END_{uuid.uuid4().hex}__"
+        self._end_re = re.compile(re.escape(self._end_marker).encode() + rb'(\d+)\n')
+        self._buffer = bytearray()
+        self.channel = transport.open_session(window_size=SSH_WINDOW_SIZE, max_packet_size=SSH_MAX_PACKET_SIZE)
+        try:
+            self.channel.invoke_shell()
+            # Discard anything the login shell prints before the first command
+            self.run('true')
+        except Exception:
+            self.channel.close()
+            raise
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def run(self, cmd):
+        """Run a command in a subshell. Returns (combined stdout/stderr, exit status)."""
+        # Subshell isolates cd/set -e/exit from the session; stdin is detached so
+        # a command can't swallow the input for the commands that follow it
+        self.channel.sendall(f"( {cmd}\n) </dev/null 2>&1; echo \"{self._end_marker}$?\"\n".encode())
+        
+        search_from = 0
+        while True:
+            match = self._end_re.search(self._buffer, search_from)
+            if match:
+                output = bytes(self._buffer[:match.start()]).decode(errors='replace')
+                exit_status = int(match.group(1))
+                del self._buffer[:match.end()]
+                return output, exit_status
+            
+            # The marker may straddle two reads; rescan just the tail
+            search_from = max(0, len(self._buffer) - len(self._end_marker) - 8)
+            data = self.channel.recv(32768)
+            if not data:
+                raise Exception("SSH session closed unexpectedly")
+            self._buffer += data
+    
+    def close(self):
+        """Close the session channel (the pooled connection stays open)"""
+        self.channel.close()
+        # Free the host's session slot exactly once, even if close() is repeated
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+
+class AsyncSSHPool:
+    """Per-host AsyncSSH connections, all driven by one asyncio event loop.
+    
+    Offers the same session() interface as SSHPool, so the worker threads are
+    unchanged; their commands are multiplexed on the loop thread instead of each
+    connection running its own paramiko transport thread.
+    """
+    
+    def __init__(self, asyncssh, username='root', timeout=10, keepalive=30, max_sessions=DEFAULT_MAX_SESSIONS_PER_HOST):
+        # Imported here rather than at module top: asyncio adds ~40ms to every
+        # command, and only this backend needs it
+        import asyncio
+        self.asyncio = asyncio
+        self.asyncssh = asyncssh
+        # asyncssh logs every channel open/close at INFO
+        logging.getLogger('asyncssh').setLevel(logging.WARNING)
+        self.username = username
+        self.timeout = timeout
+        self.keepalive = keepalive
+        self.max_sessions = max_sessions
+        # Only touched from the loop thread, so no locking beyond asyncio's own
+        self._conns = {}
+        self._connect_locks = {}
+        self._semaphores = {}
+        self._loop = self.asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def call(self, coro):
+        """Run a coroutine on the pool's event loop and wait for its result"""
+        return self.asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    async def connect(self, ip):
+        """Get a connection for a host, (re)connecting if needed"""
+        async with self._connect_locks.setdefault(ip, self.asyncio.Lock()):
+            conn = self._conns.get(ip)
+            if conn is not None and not conn.is_closed():
+                return conn
+            
+            conn = await self.asyncssh.connect(
+                ip,
+                username=self.username,
+                known_hosts=None,
+                connect_timeout=self.timeout,
+                keepalive_interval=self.keepalive,
+                window=SSH_WINDOW_SIZE,
+                max_pktsize=SSH_MAX_PACKET_SIZE
+            )
+            self._conns[ip] = conn
+            return conn
+    
+    async def run(self, ip, cmd):
+        """Run a command on a host. Returns (combined stdout/stderr, exit status)."""
+        # Cap concurrent channels per host so sshd's MaxStartups/MaxSessions aren't tripped
+        async with self._semaphores.setdefault(ip, self.asyncio.Semaphore(self.max_sessions)):
+            conn = await self.connect(ip)
+            result = await conn.run(cmd, check=False, stdin=self.asyncssh.DEVNULL, stderr=self.asyncssh.STDOUT)
+        
+        exit_status = result.exit_status if result.exit_status is not None else -1
+        return result.stdout, exit_status
+    
+    def session(self, ip):
+        """Open a session for a host (connects eagerly so errors surface here, as with SSHPool)"""
+        self.call(self.connect(ip))
+        return AsyncSSHSession(self, ip)
+    
+    def close(self):
+        """Close all connections and stop the event loop"""
+        async def close_all():
+            conns = list(self._conns.values())
+            self._conns.clear()
+            for conn in conns:
+                conn.close()
+                await conn.wait_closed()
+        
+        try:
+            self.call(close_all())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+class AsyncSSHSession:
+    """SSHSession counterpart for AsyncSSHPool; each command runs on its own channel"""
+    
+    def __init__(self, pool, ip):
+        self.pool = pool
+        self.ip = ip
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def run(self, cmd):
+        """Run a command. Returns (combined stdout/stderr, exit status)."""
+        return self.pool.call(self.pool.run(self.ip, cmd))
+    
+    def close(self):
+        """Nothing to release; channels close when their command finishes"""
 
 
 class Notifier:
@@ -818,12 +1306,98 @@ class Notifier:
         
         if self.enabled and config.get('provider') == 'ntfy':
             self.ntfy_config = config['ntfy']
+        
+        if self.enabled:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            # Keep-alive session; connection errors and transient 5xx are retried by urllib3
+            retry = Retry(
+                total=3,
+                backoff_factor=2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(['POST']),
+                raise_on_status=False
+            )
+            # One ntfy server and one delivery thread, so a single kept-alive connection is enough
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry)
+            self.session = requests.Session()
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            
+            # Sends are queued and delivered in order by a background worker
+            self._queue = queue.Queue()
+            threading.Thread(target=self._worker, daemon=True).start()
+        
+        # Notifications held back while batching (None when not batching)
+        self._batch = None
     
     def send(self, title, message, priority='default', tags='computer'):
-        """Send notification"""
+        """Queue a notification for delivery"""
         if not self.enabled:
             return
         
+        if self._batch is not None:
+            self._batch.append((title, message, priority, tags))
+            return
+        
+        self._queue.put((title, message, priority, tags))
+    
+    def begin_batch(self):
+        """Hold notifications until flush_batch() so they go out as one message"""
+        if self.enabled and self._batch is None:
+            self._batch = []
+    
+    def flush_batch(self):
+        """Queue the notifications held since begin_batch() as one combined message"""
+        batch, self._batch = self._batch, None
+        if not batch:
+            return
+        
+        if len(batch) == 1:
+            self._queue.put(batch[0])
+            return
+        
+        # The most urgent notification supplies the title and priority
+        title, _, priority, _ = max(batch, key=lambda item: _PRIORITY_RANK.get(item[2], 3))
+        message = "\n\n".join(item[1] for item in batch)
+        tags = ','.join(dict.fromkeys(tag for item in batch for tag in item[3].split(',')))
+        self._queue.put((title, message, priority, tags))
+    
+    @contextmanager
+    def batch(self):
+        """Context manager that combines every notification sent inside it into one"""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.flush_batch()
+    
+    def flush(self):
+        """Block until all queued notifications have been delivered"""
+        if not self.enabled:
+            return
+        
+        self._queue.join()
+    
+    def close(self):
+        """Deliver queued notifications, then close the HTTP session"""
+        self.flush()
+        if self.enabled:
+            self.session.close()
+    
+    def _worker(self):
+        """Deliver queued notifications"""
+        while True:
+            title, message, priority, tags = self._queue.get()
+            try:
+                self._post(title, message, priority, tags)
+            finally:
+                self._queue.task_done()
+    
+    def _post(self, title, message, priority, tags):
+        """Post a single notification to ntfy"""
         try:
             # Remove emojis from title for header compatibility
             # Keep full unicode in message body
@@ -831,40 +1405,25 @@ class Notifier:
             
             url = f"{self.ntfy_config['server']}/{self.ntfy_config['topic']}"
             
-            # Retry up to 3 times with a fresh connection each time
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = requests.post(
-                        url,
-                        data=message.encode('utf-8'),
-                        headers={
-                            'Title': title_clean if title_clean else 'Docker Manager',
-                            'Priority': priority,
-                            'Tags': tags
-                        },
-                        auth=(self.ntfy_config['username'], self.ntfy_config['password']),
-                        timeout=10  # Add timeout
-                    )
-                    if response.status_code != 200:
-                        self.logger.warning(f"Notification HTTP {response.status_code}: {response.text[:200]}")
-                    response.raise_for_status()
-                    break  # Success, exit retry loop
-                except requests.exceptions.HTTPError as e:
-                    self.logger.error(f"Notification HTTP error: {e}, response: {e.response.text[:200] if e.response else 'N/A'}")
-                    raise  # Don't retry on auth errors
-                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-                    if attempt < max_retries - 1:
-                        self.logger.warning(f"Notification attempt {attempt + 1} failed, retrying...")
-                        import time
-                        time.sleep(2)  # Wait 2 seconds before retry
-                    else:
-                        raise  # Last attempt failed, re-raise
+            response = self.session.post(
+                url,
+                data=message.encode('utf-8'),
+                headers={
+                    'Title': title_clean if title_clean else 'Docker Manager',
+                    'Priority': priority,
+                    'Tags': tags
+                },
+                auth=(self.ntfy_config['username'], self.ntfy_config['password']),
+                timeout=10
+            )
+            if response.status_code != 200:
+                self.logger.warning("Notification HTTP %s: %s", response.status_code, response.text[:200])
+            response.raise_for_status()
             
-            self.logger.info(f"Notification sent: {title}")
+            self.logger.info("Notification sent: %s", title)
             
         except Exception as e:
-            self.logger.error(f"Failed to send notification: {str(e)}")
+            self.logger.error("Failed to send notification: %s", e)
     
     def send_backup_summary(self, stats):
         """Send backup summary notification"""
@@ -874,31 +1433,16 @@ class Notifier:
         containers = stats.get('total_containers', 0)
         size = DockerManager.format_bytes(stats['total_backup_size'])
         
-        self.logger.info(f"Sending backup notification: {total} projects, {containers} containers")
+        self.logger.info("Sending backup notification: %d projects, %d containers", total, containers)
         
-        if failed > 0:
-            priority = 'high'
-            tags = 'warning,floppy_disk,docker'
-            title = f"🐳 Docker Manager: {success} backed up, {failed} failed"
-        elif success > 0:
-            priority = 'default'
-            tags = 'white_check_mark,floppy_disk,docker'
-            title = f"🐳 Docker Manager: {success} backups completed"
-        else:
-            priority = 'low'
-            tags = 'checkmark,floppy_disk,docker'
-            title = "🐳 Docker Manager: All backups up-to-date"
+        priority, tags, format_title = _BACKUP_STATES[(failed > 0, success > 0)]
+        title = format_title(success, failed)
         
-        message = f"""💾 Backup Complete
-━━━━━━━━━━━━━━━━━━━━
-Projects: {total} ({containers} containers)
+        failed_line = f"❌ Failed: {failed}\n" if failed > 0 else ""
+        message = f"""{_BACKUP_HEADER}Projects: {total} ({containers} containers)
 ✅ Successful: {success}
-"""
-        
-        if failed > 0:
-            message += f"❌ Failed: {failed}\n"
-        
-        message += f"\nTotal Size: {size}"
+{failed_line}
+Total Size: {size}"""
         
         self.send(title, message, priority, tags)
     
@@ -907,58 +1451,112 @@ Projects: {total} ({containers} containers)
         total = stats['total_projects']
         updated = stats['updates_successful']
         failed = stats['updates_failed']
+        up_to_date = stats['updates_skipped']
         
-        if failed > 0:
-            priority = 'high'
-            tags = 'warning,arrows_counterclockwise,docker'
-            title = f"🐳 Docker Manager: {updated} updated, {failed} failed"
-        elif updated > 0:
-            priority = 'default'
-            tags = 'white_check_mark,arrows_counterclockwise,docker'
-            title = f"🐳 Docker Manager: {updated} updates applied"
-        else:
-            priority = 'low'
-            tags = 'checkmark,docker'
-            title = "🐳 Docker Manager: All up-to-date"
+        priority, tags, format_title = _UPDATE_STATES[(failed > 0, updated > 0)]
+        title = format_title(updated, failed)
         
-        message = f"""🔄 Updates Complete
-━━━━━━━━━━━━━━━━━━━━
-Checked: {total} projects
+        failed_line = f"❌ Failed: {failed}\n" if failed > 0 else ""
+        up_to_date_line = f"✔️ Up-to-date: {up_to_date}" if up_to_date > 0 else ""
+        message = f"""{_UPDATE_HEADER}Checked: {total} projects
 ✅ Updated: {updated}
-"""
-        
-        if failed > 0:
-            message += f"❌ Failed: {failed}\n"
-        
-        up_to_date = stats['updates_skipped']
-        if up_to_date > 0:
-            message += f"✔️ Up-to-date: {up_to_date}"
+{failed_line}{up_to_date_line}"""
         
         self.send(title, message, priority, tags)
     
     def send_cleanup_notification(self, removed_count, freed_space):
         """Send cleanup notification"""
         title = "🐳 Docker Manager: Cleanup Complete"
-        message = f"""🧹 Old backups removed
-━━━━━━━━━━━━━━━━━━━━
-Backups removed: {removed_count}
+        message = f"""{_CLEANUP_HEADER}Backups removed: {removed_count}
 Space freed: {freed_space}"""
         
-        self.send(title, message, 'low', 'broom,floppy_disk')
+        self.send(title, message, 'low', _TAGS_CLEANUP)
     
     def send_prune_notification(self, hosts):
         """Send docker prune completion notification"""
         title = "🐳 Docker Manager: Docker Prune Complete"
         host_list = ', '.join(hosts)
-        message = f"""🧹 Docker prune completed
-━━━━━━━━━━━━━━━━━━━━
-Hosts: {host_list}"""
+        message = f"{_PRUNE_HEADER}Hosts: {host_list}"
         
-        self.send(title, message, 'low', 'broom,docker')
+        self.send(title, message, 'low', _TAGS_PRUNE)
 
 
-def main():
-    """Main entry point"""
+# Fast-path CLI grammar: command -> (flags, options taking a value, (positional, default)...)
+# Must produce the same namespace as the argparse parser in _build_parser()
+_CLI_COMMANDS = {
+    'run': (('force', 'refresh'), ('host',), (('project', None),)),
+    'backup': (('refresh',), ('host',), (('target', 'all'), ('project', None))),
+    'update': (('refresh',), ('host',), (('target', 'all'), ('project', None))),
+    'cleanup': ((), (), ()),
+    'docker-prune': ((), ('host',), ()),
+    'status': ((), (), ()),
+    'list': (('refresh',), (), ()),
+    'test-ssh': ((), (), ()),
+    'test-notify': ((), (), ()),
+}
+
+
+def _fast_parse_args(argv):
+    """Parse common command lines without argparse. Returns None to defer to argparse."""
+    config = DEFAULT_CONFIG
+    
+    # Global options come before the command, as with argparse subcommands
+    i = 0
+    while i < len(argv) and argv[i].startswith('-'):
+        opt, eq, value = argv[i].partition('=')
+        if opt != '--config':
+            return None
+        if not eq:
+            i += 1
+            if i == len(argv) or argv[i].startswith('-'):
+                return None
+            value = argv[i]
+        config = value
+        i += 1
+    
+    if i == len(argv) or argv[i] not in _CLI_COMMANDS:
+        return None
+    
+    command = argv[i]
+    flags, options, positionals = _CLI_COMMANDS[command]
+    args = SimpleNamespace(config=config, command=command)
+    for name in flags + options:
+        setattr(args, name, False if name in flags else None)
+    for name, default in positionals:
+        setattr(args, name, default)
+    
+    remaining = list(positionals)
+    args_iter = iter(argv[i + 1:])
+    for arg in args_iter:
+        if arg.startswith('-'):
+            # argparse fills optional positionals from one contiguous run only
+            if len(remaining) < len(positionals):
+                remaining = []
+            opt, eq, value = arg.partition('=')
+            name = opt[2:].replace('-', '_') if opt.startswith('--') else None
+            if name in flags and not eq:
+                setattr(args, name, True)
+            elif name in options:
+                if not eq:
+                    value = next(args_iter, None)
+                    if value is None or value.startswith('-'):
+                        return None
+                setattr(args, name, value)
+            else:
+                return None
+        elif remaining:
+            setattr(args, remaining.pop(0)[0], arg)
+        else:
+            return None
+    
+    return args
+
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the full argparse CLI (help, --version and error reporting), once per process"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Docker Manager - Centralized Docker backup and update management',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -973,18 +1571,21 @@ def main():
     run_parser = subparsers.add_parser('run', help='Run scheduled backup and update operations')
     run_parser.add_argument('--force', action='store_true', help='Force run regardless of schedule')
     run_parser.add_argument('--host', help='Target specific host')
+    run_parser.add_argument('--refresh', action='store_true', help='Rediscover projects instead of using the cached list')
     run_parser.add_argument('project', nargs='?', help='Target specific project')
     
     # Backup command
     backup_parser = subparsers.add_parser('backup', help='Backup operations')
     backup_parser.add_argument('target', nargs='?', default='all', help='Target (all, project name)')
     backup_parser.add_argument('--host', help='Target specific host')
+    backup_parser.add_argument('--refresh', action='store_true', help='Rediscover projects instead of using the cached list')
     backup_parser.add_argument('project', nargs='?', help='Target specific project (when using --host)')
     
     # Update command
     update_parser = subparsers.add_parser('update', help='Update operations')
     update_parser.add_argument('target', nargs='?', default='all', help='Target (all, project name)')
     update_parser.add_argument('--host', help='Target specific host')
+    update_parser.add_argument('--refresh', action='store_true', help='Rediscover projects instead of using the cached list')
     update_parser.add_argument('project', nargs='?', help='Target specific project (when using --host)')
     
     # Cleanup command
@@ -999,77 +1600,133 @@ def main():
     
     # List command
     list_parser = subparsers.add_parser('list', help='List all discovered projects')
+    list_parser.add_argument('--refresh', action='store_true', help='Rediscover projects instead of using the cached list')
     
     # Test commands
     test_parser = subparsers.add_parser('test-ssh', help='Test SSH connectivity')
     test_notify_parser = subparsers.add_parser('test-notify', help='Test notification')
     
-    args = parser.parse_args()
+    return parser
+
+
+def _exit_usage():
+    """Print a short usage line (full help stays behind --help) and exit with status 2"""
+    prog = os.path.basename(sys.argv[0])
+    print(f"usage: {prog} [--config CONFIG] {{{','.join(_CLI_COMMANDS)}}} ...", file=sys.stderr)
+    print(f"Run '{prog} --help' for details.", file=sys.stderr)
+    sys.exit(2)
+
+
+def main():
+    """Main entry point"""
+    argv = sys.argv[1:]
+    args = _fast_parse_args(argv)
     
-    if not args.command:
-        parser.print_help()
-        return
+    if args is None:
+        if not argv:
+            _exit_usage()
+        
+        # Help, --version, usage errors and anything unusual go through argparse
+        args = _build_parser().parse_args(argv)
+        
+        if not args.command:
+            _exit_usage()
     
     # Initialize manager
     manager = DockerManager(args.config)
     
-    # Execute command
-    if args.command == 'run':
-        target_host = args.host
-        target_project = args.project
-        manager.run(force=args.force, target_host=target_host, target_project=target_project)
-    
-    elif args.command == 'backup':
-        target_host = args.host
-        target_project = args.target if args.target != 'all' else args.project
-        manager.run(force=True, target_host=target_host, target_project=target_project, operation='backup')
-    
-    elif args.command == 'update':
-        target_host = args.host
-        target_project = args.target if args.target != 'all' else args.project
-        manager.run(force=True, target_host=target_host, target_project=target_project, operation='update')
-    
-    elif args.command == 'cleanup':
-        manager.cleanup_backups()
-        manager.cleanup_logs()
-    
-    elif args.command == 'docker-prune':
-        prune_hosts = []
-        for host_name in manager.config['global']['hosts']:
-            if args.host and host_name != args.host:
-                continue
-            prune_config = manager.get_host_prune_config(host_name)
-            if not prune_config['enabled']:
-                manager.logger.info(f"Skipping {host_name} - docker_prune disabled")
-                continue
-            result = manager.run_docker_prune(host_name, prune_config)
-            if result['status'] == 'success':
-                manager._record_prune_timestamp(host_name)
-                prune_hosts.append(host_name)
-        if prune_hosts and manager.notifier.enabled:
-            manager.notifier.send_prune_notification(prune_hosts)
-    
-    elif args.command == 'list':
-        projects = manager.discover_projects()
-        print("\nDiscovered Projects:")
-        print("=" * 50)
-        for host, host_projects in projects.items():
-            print(f"\n{host}:")
-            for project in host_projects:
-                print(f"  - {project['name']} ({project['path']})")
-        print()
-    
-    elif args.command == 'test-ssh':
-        success = manager.test_ssh()
-        sys.exit(0 if success else 1)
-    
-    elif args.command == 'test-notify':
-        manager.notifier.send(
-            "🧪 Docker Manager Test",
-            "If you received this, notifications are working!",
-            "low",
-            "test_tube,white_check_mark"
-        )
+    try:
+        handler = COMMANDS.get(args.command)
+        if handler is not None:
+            handler(manager, args)
+    finally:
+        manager.close()
+
+
+def _cmd_run(manager, args):
+    """run: scheduled backup and update operations"""
+    with manager.notifier.batch():
+        manager.run(force=args.force, target_host=args.host, target_project=args.project, refresh=args.refresh)
+
+
+def _cmd_backup(manager, args):
+    """backup: forced backups"""
+    target_project = args.target if args.target != 'all' else args.project
+    with manager.notifier.batch():
+        manager.run(force=True, target_host=args.host, target_project=target_project, operation='backup', refresh=args.refresh)
+
+
+def _cmd_update(manager, args):
+    """update: forced update checks"""
+    target_project = args.target if args.target != 'all' else args.project
+    with manager.notifier.batch():
+        manager.run(force=True, target_host=args.host, target_project=target_project, operation='update', refresh=args.refresh)
+
+
+def _cmd_cleanup(manager, args):
+    """cleanup: remove old backups and logs"""
+    manager.cleanup_backups()
+    manager.cleanup_logs()
+
+
+def _cmd_docker_prune(manager, args):
+    """docker-prune: prune hosts now, bypassing the schedule"""
+    prune_hosts = []
+    for host_name in manager.config['global']['hosts']:
+        if args.host and host_name != args.host:
+            continue
+        prune_config = manager.get_host_prune_config(host_name)
+        if not prune_config['enabled']:
+            manager.logger.info("Skipping %s - docker_prune disabled", host_name)
+            continue
+        result = manager.run_docker_prune(host_name, prune_config)
+        if result['status'] == 'success':
+            manager._record_prune_timestamp(host_name)
+            prune_hosts.append(host_name)
+    if prune_hosts and manager.notifier.enabled:
+        manager.notifier.send_prune_notification(prune_hosts)
+
+
+def _cmd_list(manager, args):
+    """list: print discovered projects"""
+    projects = manager.discover_projects(refresh=args.refresh)
+    
+    # Build the whole listing and write it once
+    lines = ["", "Discovered Projects:", "=" * 50]
+    for host, host_projects in projects.items():
+        lines += ["", f"{host}:"]
+        lines.extend(f"  - {project['name']} ({project['path']})" for project in host_projects)
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _cmd_test_ssh(manager, args):
+    """test-ssh: check connectivity to every host"""
+    success = manager.test_ssh()
+    sys.exit(0 if success else 1)
+
+
+def _cmd_test_notify(manager, args):
+    """test-notify: send a test notification"""
+    manager.notifier.send(
+        "🧪 Docker Manager Test",
+        "If you received this, notifications are working!",
+        "low",
+        _TAGS_TEST
+    )
+
+
+# Command handlers; 'status' is accepted by the CLI but not implemented yet
+COMMANDS = {
+    'run': _cmd_run,
+    'backup': _cmd_backup,
+    'update': _cmd_update,
+    'cleanup': _cmd_cleanup,
+    'docker-prune': _cmd_docker_prune,
+    'list': _cmd_list,
+    'test-ssh': _cmd_test_ssh,
+    'test-notify': _cmd_test_notify,
+}
 
 
 if __name__ == '__main__':